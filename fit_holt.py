@@ -0,0 +1,31 @@
+# Refits the Holt model on everything except the last TEST_LEN days and
+# writes the parameters app.py loads. Run after regenerating the Parquet
+# file:  pip install -r requirements-fit.txt && python fit_holt.py
+import pandas as pd
+import json
+from statsmodels.tsa.holtwinters import ExponentialSmoothing
+
+from forecast import DATA_FILE, PARAMS_FILE, TEST_LEN
+
+df = pd.read_parquet(DATA_FILE)
+train = df["USD"].iloc[:-TEST_LEN].asfreq("D")
+
+result = ExponentialSmoothing(
+    train,
+    trend="add",
+    initialization_method="estimated"
+).fit()
+
+params = {
+    "smoothing_level": float(result.params["smoothing_level"]),
+    "smoothing_trend": float(result.params["smoothing_trend"]),
+    "initial_level": float(result.params["initial_level"]),
+    "initial_trend": float(result.params["initial_trend"]),
+    "n_obs": len(train)
+}
+
+with open(PARAMS_FILE, "w") as f:
+    json.dump(params, f, indent=4)
+    f.write("\n")
+
+print(f"Wrote {PARAMS_FILE} (fitted on {len(train)} observations)")
@@ -0,0 +1,75 @@
+import streamlit as st
+import pandas as pd
+import json
+import os
+
+from holt import holt_filter, holt_forecast
+
+# ==============================
+# DATA & MODEL LOADING
+# ==============================
+# Trailing observations held out to evaluate the Holt model.
+TEST_LEN = 216
+
+# Parquet copy of exchange-rates-new.csv with the date index already parsed.
+DATA_FILE = "exchange-rates-new.parquet"
+# Parameters of the Holt model fitted on the first n_obs observations.
+PARAMS_FILE = "holt_params.json"
+
+# Cache key for the loaders below; regenerating either file changes it, so
+# the disk-persisted frame cannot outlive the file it was read from.
+def data_version():
+    return max(os.path.getmtime(DATA_FILE), os.path.getmtime(PARAMS_FILE))
+
+# Persisted to disk so restarted containers skip the read entirely.
+@st.cache_data(persist="disk")
+def load_data(version):
+    return pd.read_parquet(DATA_FILE)
+
+@st.cache_resource
+def load_model(version):
+    with open(PARAMS_FILE) as f:
+        params = json.load(f)
+    usd = load_data(version)["USD"].to_numpy()
+    # The test forecast is plotted against the last TEST_LEN dates, so the
+    # model must have been fitted on exactly the rows before them.
+    if params["n_obs"] != len(usd) - TEST_LEN:
+        raise ValueError(
+            f"{PARAMS_FILE} was fitted on {params['n_obs']} observations but "
+            f"{DATA_FILE} has {len(usd) - TEST_LEN} before the test window; "
+            "rerun fit_holt.py"
+        )
+    alpha = params["smoothing_level"]
+    beta = params["smoothing_trend"]
+    # "test" is the state at the end of the training window, which the
+    # held-out test forecast starts from. "future" carries on through the
+    # test window to the last observation, so forecasts past the end of the
+    # data start from the latest rate.
+    test_state = holt_filter(
+        usd[:params["n_obs"]],
+        alpha,
+        beta,
+        params["initial_level"],
+        params["initial_trend"]
+    )
+    future_state = holt_filter(usd[params["n_obs"]:], alpha, beta, *test_state)
+    return {"test": test_state, "future": future_state}
+
+# The model is two (level, trend) pairs, so it is cheap to hash into the key.
+@st.cache_data
+def compute_test_forecast(model, n):
+    return holt_forecast(*model["test"], n)
+
+@st.cache_data
+def compute_future_forecast(model, horizon):
+    return holt_forecast(*model["future"], horizon)
+
+# ==============================
+# FORECAST HORIZON
+# ==============================
+DEFAULT_HORIZON = 7
+# Default key of HISTORY_WINDOWS in views/market_insights.py.
+DEFAULT_HISTORY_WINDOW = "1Y"
+
+def horizon_slider():
+    return st.slider("📆 Forecast Horizon (Days)", 1, 30, key="horizon")
@@ -0,0 +1,34 @@
+import numpy as np
+from numba import njit, types
+
+# ==============================
+# HOLT KERNELS
+# ==============================
+# Kept out of app.py because Streamlit re-executes the app script on every
+# rerun, while this module is imported once per process. The explicit
+# signatures make numba compile (or load from its on-disk cache) at import,
+# so no user interaction pays the JIT cost.
+
+# Read-only so pandas' copy-on-write views can be passed without a copy.
+_SERIES = types.Array(types.float64, 1, "A", readonly=True)
+
+# Additive-trend Holt recursion; returns the final (level, trend) state.
+@njit(
+    types.UniTuple(types.float64, 2)(
+        _SERIES, types.float64, types.float64, types.float64, types.float64
+    ),
+    cache=True
+)
+def holt_filter(y, alpha, beta, level, trend):
+    for t in range(y.shape[0]):
+        prev_level = level
+        level = alpha * y[t] + (1 - alpha) * (level + trend)
+        trend = beta * (level - prev_level) + (1 - beta) * trend
+    return level, trend
+
+@njit("float64[:](float64, float64, int64)", cache=True)
+def holt_forecast(level, trend, h):
+    out = np.empty(h)
+    for i in range(h):
+        out[i] = level + (i + 1) * trend
+    return out
@@ -0,0 +1,129 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+
+from forecast import compute_future_forecast, horizon_slider
+
+# ==============================
+# STATIC REFERENCE DATA
+# ==============================
+PROC_NAMES = (
+    "Health Screening",
+    "Dental Implant",
+    "Knee Replacement",
+    "LASIK Eye Surgery"
+)
+PROC_COSTS_MYR = np.array([1513, 6000, 28000, 4980])
+
+HOSPITALS = {
+    "Kuala Lumpur": [
+        "Gleneagles Hospital",
+        "Prince Court Medical Centre",
+        "Sunway Medical Centre"
+    ],
+    "Penang": [
+        "Island Hospital",
+        "Gleneagles Penang",
+        "Loh Guan Lye Specialists Centre"
+    ],
+    "Johor Bahru": [
+        "KPJ Johor Specialist Hospital",
+        "Columbia Asia Hospital"
+    ],
+    "Melaka": [
+        "Mahkota Medical Centre"
+    ]
+}
+
+# ==============================
+# PAGE 2: BUDGET & HOSPITAL PLANNER
+# ==============================
+def render(model, current_rate):
+    st.title("💰 Budget & Hospital Planner")
+
+    st.markdown("---")
+    st.markdown("### 🧮 Medical Cost Conversion")
+
+    user_cost_myr = st.number_input(
+        "Enter estimated treatment cost (MYR):",
+        min_value=100,
+        value=20000
+    )
+
+    horizon = horizon_slider()
+    future_forecast = compute_future_forecast(model, horizon)
+    avg_future = future_forecast.mean()
+
+    rates = np.array([current_rate, avg_future])
+    cost_usd = user_cost_myr / rates
+
+    calc_df = pd.DataFrame({
+        "Scenario": ["Pay Today", f"Pay in {horizon} Days"],
+        "Exchange Rate": [current_rate, avg_future],
+        "Estimated Cost (USD)": cost_usd
+    })
+
+    st.dataframe(
+        calc_df,
+        column_config={
+            "Exchange Rate": st.column_config.NumberColumn(format="%.4f"),
+            "Estimated Cost (USD)": st.column_config.NumberColumn(
+                format="dollar"
+            )
+        },
+        hide_index=True
+    )
+
+    # ----- Procedure Cost Analysis -----
+    st.markdown("#### 📑 Standard Procedure Cost Analysis")
+
+    # One broadcast: rows are procedures, columns are (current, forecast).
+    proc_usd = PROC_COSTS_MYR[:, None] / rates
+
+    proc_df = pd.DataFrame({
+        "Procedure": PROC_NAMES,
+        "Cost_MYR": PROC_COSTS_MYR,
+        "USD (Current)": proc_usd[:, 0],
+        "USD (Forecasted)": proc_usd[:, 1],
+        "Difference": proc_usd[:, 0] - proc_usd[:, 1]
+    })
+
+    usd_column = st.column_config.NumberColumn(format="dollar")
+    st.dataframe(
+        proc_df,
+        column_config={
+            "Cost_MYR": st.column_config.NumberColumn(
+                "Cost (MYR)", format="localized"
+            ),
+            "USD (Current)": usd_column,
+            "USD (Forecasted)": usd_column,
+            "Difference": usd_column
+        },
+        hide_index=True
+    )
+
+    # ----- Savings -----
+    savings = cost_usd[0] - cost_usd[1]
+
+    if savings > 0:
+        st.success(f"💡 Potential savings: **${savings:,.2f} USD**")
+    else:
+        st.info("ℹ️ No significant exchange advantage detected.")
+
+    st.markdown("---")
+
+    # ----- Hospital Recommendation -----
+    st.subheader("📍 Find Accredited Hospitals")
+
+    location = st.selectbox(
+        "Where are you planning to visit?",
+        list(HOSPITALS)
+    )
+
+    st.write(f"Top JCI-Accredited hospitals in **{location}**:")
+    for hosp in HOSPITALS[location]:
+        st.info(f"🏢 {hosp}")
+
+    st.caption(
+        "Hospital listings are informational and do not imply endorsement."
+    )
@@ -0,0 +1,146 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import plotly.graph_objects as go
+from tsdownsample import LTTBDownsampler
+
+from forecast import (
+    TEST_LEN,
+    compute_future_forecast,
+    compute_test_forecast,
+    horizon_slider
+)
+
+# ==============================
+# CHART HELPERS
+# ==============================
+# Below this many points SVG rendering is cheap enough; above it, WebGL wins.
+SCATTERGL_MIN_POINTS = 1000
+# A full-width chart cannot resolve more points than this.
+MAX_PLOT_POINTS = 2000
+# Trailing days of training history to plot; None plots all of it.
+HISTORY_WINDOWS = {"3M": 90, "6M": 182, "1Y": 365, "All": None}
+
+def scatter_trace(x, y, **kwargs):
+    if len(y) >= SCATTERGL_MIN_POINTS:
+        return go.Scattergl(x=x, y=y, **kwargs)
+    return go.Scatter(x=x, y=y, **kwargs)
+
+def downsample(series, n_out=MAX_PLOT_POINTS):
+    if len(series) <= n_out:
+        return series
+    idx = LTTBDownsampler().downsample(
+        series.index.values.astype("int64"),
+        series.values,
+        n_out=n_out
+    )
+    return series.iloc[idx]
+
+# Horizon-independent traces; the caller adds the future forecast.
+# Not cached: copying a shared Figure costs more than rebuilding it, and
+# st.plotly_chart re-validates plain dict specs into a Figure anyway.
+# Trace values are sent as float32 to halve the figure payload.
+def build_base_figure(usd, model, history_days):
+    train = usd.iloc[:-TEST_LEN]
+    if history_days:
+        train = train.iloc[-history_days:]
+    test = usd.iloc[-TEST_LEN:]
+    test_forecast = compute_test_forecast(model, TEST_LEN)
+
+    train_plot = downsample(train)
+    test_plot = downsample(test)
+
+    fig = go.Figure()
+
+    fig.add_trace(scatter_trace(
+        x=train_plot.index,
+        y=train_plot.values.astype(np.float32, copy=False),
+        name="Historical Data"
+    ))
+
+    fig.add_trace(scatter_trace(
+        x=test_plot.index,
+        y=test_plot.values.astype(np.float32, copy=False),
+        name="Testing Data (Actual)"
+    ))
+
+    fig.add_trace(scatter_trace(
+        x=test.index,
+        y=test_forecast.astype(np.float32),
+        name="Testing Forecast",
+        line=dict(dash="dash")
+    ))
+
+    fig.update_layout(
+        title="Holt (Double Exponential Smoothing) Exchange Rate Forecast",
+        xaxis_title="Date",
+        yaxis_title="USD/MYR",
+        # Keeps the user's zoom/pan when a horizon change redraws the chart;
+        # the axes inherit this value.
+        uirevision="static"
+    )
+
+    return fig
+
+# ==============================
+# PAGE 1: MARKET INSIGHTS
+# ==============================
+# Only this fragment reruns when the horizon slider moves.
+@st.fragment
+def market_insights_fragment(df, model, current_rate, history_window):
+    horizon = horizon_slider()
+
+    future_dates = pd.date_range(
+        start=df.index.max() + pd.Timedelta(days=1),
+        periods=horizon,
+        freq="D"
+    )
+
+    future_forecast = compute_future_forecast(model, horizon)
+    avg_future = future_forecast.mean()
+
+    col1, col2 = st.columns(2)
+    col1.metric("💱 Current USD/MYR", f"{current_rate:.4f}")
+    col2.metric(
+        f"📅 {horizon}-Day Avg Forecast",
+        f"{avg_future:.4f}",
+        delta=f"{avg_future - current_rate:.4f}",
+        delta_color="inverse"
+    )
+
+    st.subheader("💡 Action Plan for Patients")
+    if avg_future > current_rate:
+        st.success(
+            "**Highly Favorable Timing**\n"
+            "USD is expected to strengthen, increasing purchasing power "
+            "for medical procedures in Malaysia."
+        )
+    else:
+        st.warning(
+            "**Monitor the Market**\n"
+            "Rates appear stable. Consider flexibility if treatment timing allows."
+        )
+
+    fig = build_base_figure(
+        df["USD"], model, HISTORY_WINDOWS[history_window]
+    )
+
+    fig.add_trace(scatter_trace(
+        x=future_dates,
+        y=future_forecast.astype(np.float32),
+        name="Future Forecast",
+        line=dict(dash="dot")
+    ))
+
+    st.plotly_chart(fig, use_container_width=True)
+
+def render(df, model, current_rate):
+    st.title("📊 Exchange Rate & Action Plan")
+
+    history_window = st.sidebar.selectbox(
+        "🕰️ History Window",
+        list(HISTORY_WINDOWS),
+        key="history_window"
+    )
+
+    market_insights_fragment(df, model, current_rate, history_window)
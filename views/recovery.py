@@ -0,0 +1,75 @@
+import streamlit as st
+
+# ==============================
+# STATIC REFERENCE DATA
+# ==============================
+RECOVERY_ACTIVITIES = {
+    "Cardiac/Major Surgery": [
+        "Quiet indoor activities",
+        "Gentle breathing exercises"
+    ],
+    "Orthopedic (Joint/Knee)": [
+        "Short flat walks (parks, gardens)",
+        "Museums with elevator access"
+    ],
+    "Cosmetic/Dental": [
+        "Light cultural tours",
+        "Wellness activities (doctor-approved)"
+    ],
+    "General Wellness": [
+        "Light cultural tours",
+        "Wellness activities (doctor-approved)"
+    ]
+}
+
+NUTRITION_GUIDANCE = {
+    "Cardiac/Major Surgery": [
+        "Low-sodium meals",
+        "Heart-healthy fats"
+    ],
+    "Orthopedic (Joint/Knee)": [
+        "Protein-rich foods",
+        "Anti-inflammatory nutrients"
+    ],
+    "Cosmetic/Dental": [
+        "Adequate hydration",
+        "Immune-supportive nutrition"
+    ],
+    "General Wellness": [
+        "Adequate hydration",
+        "Immune-supportive nutrition"
+    ]
+}
+
+RISK_MAP = {
+    "Cardiac/Major Surgery": "🔴 High caution required",
+    "Orthopedic (Joint/Knee)": "🟡 Moderate caution required",
+    "Cosmetic/Dental": "🟢 Low risk activities",
+    "General Wellness": "🟢 Low risk activities"
+}
+
+# ==============================
+# PAGE 3: RECOVERY & TRAVEL
+# ==============================
+def render():
+    st.title("🌿 Recovery & Wellness Planning")
+    st.markdown("### 🩺 Post-Treatment Lifestyle Support")
+
+    treatment = st.selectbox(
+        "Select your treatment category:",
+        list(RISK_MAP)
+    )
+
+    st.subheader("🧘 Recommended Activities")
+    for activity in RECOVERY_ACTIVITIES[treatment]:
+        st.write(f"- {activity}")
+
+    st.subheader("🥗 Nutrition Guidance")
+    for item in NUTRITION_GUIDANCE[treatment]:
+        st.write(f"- {item}")
+
+    st.warning(f"⚠️ Recovery Risk Level: **{RISK_MAP[treatment]}**")
+    st.info(
+        "Always follow hospital discharge instructions "
+        "and consult your doctor."
+    )